@@ -2,49 +2,381 @@
 Tkinter + asyncio RSS reader for Thanh Nien.
 """
 import asyncio
+import concurrent.futures
+import hashlib
 import html
+import os
+import re
+import stat
+import tempfile
 import threading
 import webbrowser
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Any, Coroutine, List, Optional, TypeVar
+from pathlib import Path
+from typing import Any, Callable, Coroutine, List, Mapping, Optional, TypeVar
+from urllib.parse import urlsplit
 
 T = TypeVar("T")
 
 import aiohttp
 from bs4 import BeautifulSoup
-from PIL import Image, ImageTk
+from PIL import Image
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    from lxml import etree as ET
+
+    # libxml2 is much faster than ElementTree/html.parser and tolerates sloppy markup.
+    HAS_LXML = True
+    XML_PARSER_OPTIONS: dict[str, Any] = {"recover": True, "huge_tree": True}
+except ImportError:  # pragma: no cover - lxml is optional
+    import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+    XML_PARSER_OPTIONS = {}
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20)
+USER_AGENT = "BaoReader/1.0"
+MAX_IMAGE_DOWNLOADS = 8
+MAX_IMAGES = 8
+MAX_DISPLAY_WIDTH = 700
+# Each entry is raw PPM, about 0.8 MB for a 700px wide image, so ~64 MB in total.
+IMAGE_MEMORY_CACHE_SIZE = 80
+IMAGE_DISK_CACHE_SIZE = 2000
+# Prune the disk cache again after this many new files during a session.
+IMAGE_PRUNE_INTERVAL = 200
+NON_CONTENT_IMAGE_RE = re.compile(r"(?:^|[/_.-])(?:pixel|tracker|ads)(?:[/_.-]|$)", re.IGNORECASE)
+
+
+def _decode_for_display(data: bytes, max_width: int = MAX_DISPLAY_WIDTH) -> Image.Image:
+    """Decode raw image bytes and shrink them to fit the content pane.
+
+    Runs in a worker thread, so it must not touch any Tk objects.
+    """
+    image = Image.open(BytesIO(data))
+    if image.width > max_width:
+        # JPEGs can be scaled by 1/2, 1/4 or 1/8 while decoding; draft never goes
+        # below the requested size, so the final resize below stays a downscale.
+        image.draft("RGB", (max_width, image.height * max_width // image.width))
+    image.load()
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if image.width > max_width:
+        ratio = max_width / image.width
+        new_size = (int(image.width * ratio), int(image.height * ratio))
+        image = image.resize(new_size, Image.BILINEAR, reducing_gap=2.0)
+    return image
+
+
+def _encode_ppm(image: Image.Image) -> bytes:
+    """Serialize an RGB image as binary PPM, which ``tk.PhotoImage`` reads natively.
+
+    Tk accepts base64 ``-data`` only for PNG and GIF; PPM must stay raw bytes.
+    """
+    buf = BytesIO()
+    image.save(buf, format="PPM")
+    return buf.getvalue()
+
+
+def _prepare_image_data(data: bytes, cache_path: Optional[Path] = None) -> bytes:
+    """Turn downloaded image bytes into display-ready PhotoImage data.
+
+    Doing the PPM conversion here, in the worker thread, leaves the Tk thread
+    with only a cheap ``tk.PhotoImage(data=...)`` call per image. When
+    ``cache_path`` is given the resized image is also stored there as JPEG.
+    """
+    image = _decode_for_display(data)
+    if cache_path is not None:
+        _save_cached_image(image, cache_path)
+    return _encode_ppm(image)
+
+
+def _save_cached_image(image: Image.Image, path: Path) -> None:
+    # Write to a temporary file first so readers never see a partial JPEG.
+    tmp_name: Optional[str] = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_name = tmp.name
+            image.save(tmp, format="JPEG", quality=85)
+        os.replace(tmp_name, path)
+    except OSError:
+        # The cache is best effort; a failed write only costs a re-download.
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _load_cached_image(path: Path) -> Optional[bytes]:
+    """Return PhotoImage data for a cached image, or ``None`` on a miss."""
+    try:
+        data = path.read_bytes()
+        # Refresh the mtime so pruning evicts the least recently used files.
+        os.utime(path)
+        return _encode_ppm(_decode_for_display(data))
+    except OSError:
+        return None
+
+
+def _default_image_cache_dir() -> Path:
+    # A per-user name so users sharing the temp dir never share (or block) a cache.
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return Path(tempfile.gettempdir()) / f"bao_imgcache{suffix}"
+
+
+def _ensure_private_dir(directory: Path) -> bool:
+    """Create ``directory`` for the current user only; refuse one owned by anyone else.
+
+    Cache keys are plain URL hashes, so a directory another user controls could
+    be used to plant images that get shown for chosen articles.
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = directory.lstat()
+        if not stat.S_ISDIR(info.st_mode):
+            return False
+        if hasattr(os, "getuid"):
+            # Others may already have written into a group/world-writable directory.
+            if info.st_uid != os.getuid() or info.st_mode & 0o022:
+                return False
+            if stat.S_IMODE(info.st_mode) != 0o700:
+                directory.chmod(0o700)
+    except OSError:
+        return False
+    return True
+
+
+class ImageCache:
+    """Display-ready article images keyed by a hash of their source URL.
+
+    Recently shown images stay in memory as PhotoImage data; every image is
+    also written to ``directory`` as a resized JPEG so reopening an article
+    skips both the download and the full-size decode. Memory lookups happen on
+    the event loop thread only; disk access goes through the executor. If the
+    directory cannot be made private to the current user, only the memory
+    cache is used.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = IMAGE_MEMORY_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._writes = 0
+        self.directory: Optional[Path] = directory if _ensure_private_dir(directory) else None
+
+    @staticmethod
+    def key_for(src: str) -> str:
+        return hashlib.blake2b(src.encode("utf-8"), digest_size=16).hexdigest()
+
+    def path_for(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.jpg"
+
+    def get(self, key: str) -> Optional[bytes]:
+        image_data = self._memory.get(key)
+        if image_data is not None:
+            self._memory.move_to_end(key)
+        return image_data
+
+    def put(self, key: str, image_data: bytes) -> None:
+        self._memory[key] = image_data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def record_write(self) -> bool:
+        """Count a file written to disk; true every ``IMAGE_PRUNE_INTERVAL`` writes."""
+        self._writes += 1
+        return self._writes % IMAGE_PRUNE_INTERVAL == 0
+
+    def prune(self, max_files: int = IMAGE_DISK_CACHE_SIZE) -> None:
+        """Delete the least recently used files beyond ``max_files``."""
+        if self.directory is None:
+            return
+        entries = []
+        try:
+            for path in self.directory.glob("*.jpg"):
+                entries.append((path.stat().st_mtime, path))
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        for _mtime, path in entries[max_files:]:
+            try:
+                path.unlink()
+            except OSError:
+                # Already gone or not ours to delete; keep pruning the rest.
+                pass
+
 
 @dataclass
-class Article:
-    title: str
-    link: str
-    categories: List[str]
+class Feed:
+    """Articles of a feed stored column-wise, one list per field.
+
+    The article list reads whole columns at a time, so parallel lists save an
+    object and its attribute lookups for every row.
+    """
+
+    titles: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    # Already joined with ", "; empty when the item has no category.
+    categories: List[str] = field(default_factory=list)
+
+
+def _collect_feed_items(parser: Any, feed: Feed) -> None:
+    """Append the ``<item>`` elements the pull parser has finished to ``feed``."""
+    for _event, item_el in parser.read_events():
+        if item_el.tag != "item":
+            continue
+        title = html.unescape(item_el.findtext("title", default="(Không tiêu đề)"))
+        link = item_el.findtext("link", default="")
+        categories = [html.unescape(cat.text.strip()) for cat in item_el.findall("category") if cat.text]
+        if link:
+            feed.titles.append(title)
+            feed.links.append(link)
+            feed.categories.append(", ".join(categories))
+        # Free the parsed item; lxml also keeps finished siblings attached, drop those too.
+        item_el.clear()
+        if hasattr(item_el, "getprevious"):
+            parent = item_el.getparent()
+            while parent is not None and item_el.getprevious() is not None:
+                del parent[0]
+
+
+def _is_content_image(attrs: Mapping[str, Any]) -> bool:
+    """Tell article images apart from tracking pixels, inline data and ads."""
+    src = attrs.get("src")
+    if not src or src.startswith("data:"):
+        return False
+    for dimension in ("width", "height"):
+        value = str(attrs.get(dimension, "")).strip().removesuffix("px")
+        if value.isdigit() and int(value) <= 2:
+            return False
+    return not NON_CONTENT_IMAGE_RE.search(urlsplit(src).path)
+
+
+class _ArticleCollector:
+    """lxml parser target that keeps only paragraph text and image sources."""
+
+    def __init__(self) -> None:
+        self.paragraphs: list[str] = []
+        self.srcs: list[str] = []
+        self._in_p = False
+        self._buf: list[str] = []
+
+    def start(self, tag: str, attrs: dict[str, str]) -> None:
+        if tag == "p":
+            self._in_p = True
+            self._buf.clear()
+        elif tag == "img" and _is_content_image(attrs):
+            self.srcs.append(attrs["src"])
+
+    def data(self, data: str) -> None:
+        if self._in_p:
+            self._buf.append(data)
+
+    def end(self, tag: str) -> None:
+        if tag == "p" and self._in_p:
+            self._in_p = False
+            text = "".join(self._buf).strip()
+            if text:
+                self.paragraphs.append(html.unescape(text))
+
+    def close(self) -> None:
+        return None
+
+
+def _extract_article(page: bytes, encoding: Optional[str] = None) -> tuple[list[str], list[str]]:
+    """Return the paragraph texts and image sources of an article page.
+
+    Used when lxml is not installed; otherwise ``_ArticleCollector`` parses the
+    page while it downloads. ``encoding`` is the charset from the HTTP headers,
+    if any; without it BeautifulSoup reads the page's own ``<meta charset>``.
+    """
+    soup = BeautifulSoup(page, "html.parser", from_encoding=encoding)
+    paragraphs = [html.unescape(text) for p in soup.find_all("p") if (text := p.get_text(strip=True))]
+    srcs = [img["src"] for img in soup.find_all("img") if _is_content_image(img.attrs)]
+    return paragraphs, srcs
 
 
 class AsyncioThread(threading.Thread):
     """Run an asyncio event loop in a background thread.
 
     Tkinter must run on the main thread, so network tasks live in the loop below.
-    The ``submit`` helper schedules coroutines without blocking the UI.
+    The ``submit`` helper schedules coroutines without blocking the UI. A single
+    ``ClientSession`` is shared by all requests so connections are kept alive and
+    pooled between RSS refreshes, article pages and their images.
     """
 
     def __init__(self) -> None:
         super().__init__(daemon=True)
         self.loop = asyncio.new_event_loop()
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Owned here: a connector never closes a resolver it was handed.
+        self.resolver: Optional[aiohttp.abc.AbstractResolver] = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        super().start()
+        # Block until the session exists so callers can submit work right away.
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
 
     def run(self) -> None:
         asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._open_session())
+        except BaseException as exc:
+            # Hand the failure to start() instead of leaving the UI thread waiting.
+            self._startup_error = exc
+            return
+        finally:
+            self._ready.set()
         self.loop.run_forever()
 
-    def submit(self, coro: Coroutine[Any, Any, T]) -> asyncio.Future[T]:
+    async def _open_session(self) -> None:
+        try:
+            # aiodns resolves without tying up executor threads during image bursts.
+            self.resolver = aiohttp.AsyncResolver()
+        except RuntimeError:  # aiodns is not installed
+            self.resolver = aiohttp.ThreadedResolver()
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            resolver=self.resolver,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            # No Accept-Encoding override: aiohttp already offers br (and zstd)
+            # whenever it can import a decoder for them.
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    async def _close_session(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+        if self.resolver is not None:
+            # Releases the aiodns channel, which session.close() leaves open.
+            await self.resolver.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
         return asyncio.run_coroutine_threadsafe(coro, self.loop)
 
     def shutdown(self) -> None:
+        if self.session is not None or self.resolver is not None:
+            try:
+                self.submit(self._close_session()).result(timeout=5)
+            except Exception:  # noqa: BLE001
+                # Closing is best effort; the process is exiting anyway.
+                pass
         self.loop.call_soon_threadsafe(self.loop.stop)
 
 
@@ -67,11 +399,22 @@ class NewsReaderApp:
             "Kinh doanh": "https://thanhnien.vn/rss/kinh-doanh.rss",
             "Văn hóa": "https://thanhnien.vn/rss/van-hoa.rss",
         }
-
-        self.articles: List[Article] = []
-        self.image_refs: List[ImageTk.PhotoImage] = []
+        self._feed_keys = list(self.default_feeds)
+
+        self.article_titles: List[str] = []
+        self.article_links: List[str] = []
+        self.article_categories: List[str] = []
+        # url -> (ETag, Last-Modified, feed) for conditional feed refreshes.
+        self.feed_cache: dict[str, tuple[str, str, Feed]] = {}
+        self.image_refs: List[tk.PhotoImage] = []
+        self.image_cache = ImageCache(_default_image_cache_dir())
+        self.async_thread.submit(asyncio.to_thread(self.image_cache.prune))
         self.current_article_link: Optional[str] = None
-        self.current_categories: List[str] = []
+        self.more_image_srcs: List[str] = []
+        # The article fetch whose result may still be shown; older ones are cancelled.
+        self._current_fetch: Optional[concurrent.futures.Future] = None
+        self._more_images_fetch: Optional[concurrent.futures.Future] = None
+        self.current_category = ""
 
         self._build_layout()
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -113,11 +456,11 @@ class NewsReaderApp:
         ttk.Label(top_frame, text="Chọn chuyên mục:", style="Subheading.TLabel").pack(
             side=tk.LEFT, padx=(0, 8)
         )
-        self.feed_choice = tk.StringVar(value=list(self.default_feeds.keys())[0])
+        self.feed_choice = tk.StringVar(value=self._feed_keys[0])
         feed_combo = ttk.Combobox(
             top_frame,
             textvariable=self.feed_choice,
-            values=list(self.default_feeds.keys()),
+            values=self._feed_keys,
             width=24,
             state="readonly",
         )
@@ -173,6 +516,10 @@ class NewsReaderApp:
         ttk.Label(meta_frame, textvariable=self.category_var, style="TLabel").pack(side=tk.LEFT)
         self.link_button = ttk.Button(meta_frame, text="Mở bài gốc", command=self.open_current_article, state=tk.DISABLED)
         self.link_button.pack(side=tk.RIGHT)
+        self.more_images_button = ttk.Button(
+            meta_frame, text="Tải thêm ảnh", command=self.load_more_images, state=tk.DISABLED
+        )
+        self.more_images_button.pack(side=tk.RIGHT, padx=(0, 8))
 
         content_container = ttk.Frame(right_frame)
         content_container.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
@@ -190,6 +537,10 @@ class NewsReaderApp:
         content_scroll = ttk.Scrollbar(content_container, orient=tk.VERTICAL, command=self.content_text.yview)
         content_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.content_text.config(yscrollcommand=content_scroll.set)
+        self.content_text.tag_config("title", font=("Arial", 15, "bold"))
+        self.content_text.tag_config("meta", font=("Arial", 10, "italic"))
+        self.content_text.tag_config("link", foreground="#1a73e8", underline=1)
+        self.content_text.tag_bind("link", "<Button-1>", lambda _event: self.open_current_article())
 
     def on_feed_selected(self, event: tk.Event) -> None:
         self.load_feed()
@@ -203,50 +554,79 @@ class NewsReaderApp:
         future = self.async_thread.submit(self.fetch_rss(url))
         future.add_done_callback(self._handle_feed_result)
 
-    def _handle_feed_result(self, fut: asyncio.Future) -> None:
+    def _handle_feed_result(self, fut: concurrent.futures.Future) -> None:
         try:
-            articles = fut.result()
+            feed = fut.result()
         except Exception as exc:  # noqa: BLE001
-            self.root.after(0, lambda: messagebox.showerror("Lỗi tải RSS", str(exc)))
+            # Bind exc now: Python unbinds it when the except block ends.
+            self.root.after(0, lambda exc=exc: messagebox.showerror("Lỗi tải RSS", str(exc)))
             self.root.after(0, lambda: self.load_button.config(state=tk.NORMAL))
             return
-        self.root.after(0, lambda: self.populate_list(articles))
+        self.root.after(0, lambda: self.populate_list(feed))
         self.root.after(0, lambda: self.load_button.config(state=tk.NORMAL))
 
-    async def fetch_rss(self, url: str) -> List[Article]:
+    async def fetch_rss(self, url: str) -> Feed:
         """Download and parse the RSS feed asynchronously."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=20) as resp:
-                resp.raise_for_status()
-                content = await resp.text()
-
-        root = ET.fromstring(content)
-        items = []
-        for item_el in root.findall(".//item"):
-            title = html.unescape(item_el.findtext("title", default="(Không tiêu đề)"))
-            link = item_el.findtext("link", default="")
-            categories = [html.unescape(cat.text.strip()) for cat in item_el.findall("category") if cat.text]
-            if link:
-                items.append(Article(title=title, link=link, categories=categories))
-        return items
-
-    def populate_list(self, articles: List[Article]) -> None:
-        self.articles = articles
-        for item in self.article_tree.get_children():
-            self.article_tree.delete(item)
-        for idx, art in enumerate(articles):
-            category_label = ", ".join(art.categories) if art.categories else "-"
-            tags = ("oddrow",) if idx % 2 else ()
-            self.article_tree.insert(
-                "", tk.END, iid=str(idx), values=(art.title, category_label), tags=tags
+        session = self.async_thread.session
+        cached = self.feed_cache.get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        # Feed the parser while the body downloads so the whole document is never
+        # held in memory; the parser reads the encoding from the XML declaration.
+        parser = ET.XMLPullParser(events=("end",), **XML_PARSER_OPTIONS)
+        feed = Feed()
+        async with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status == 304 and cached is not None:
+                # Unchanged since the last refresh, reuse the parsed articles.
+                return cached[2]
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(16384):
+                parser.feed(chunk)
+                _collect_feed_items(parser, feed)
+        parser.close()
+        _collect_feed_items(parser, feed)
+
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        if etag or last_modified:
+            self.feed_cache[url] = (etag, last_modified, feed)
+        return feed
+
+    def populate_list(self, feed: Feed) -> None:
+        self._cancel_article_fetch()
+        self.article_titles = feed.titles
+        self.article_links = feed.links
+        self.article_categories = feed.categories
+        tree = self.article_tree
+        tree.delete(*tree.get_children())
+        # Call the Tcl command directly: Treeview.insert re-parses its keyword
+        # options on every row, which adds up for long feeds. Tk only redraws
+        # once we return to the event loop, so the rows appear in one go.
+        tcl_call = tree.tk.call
+        widget = tree._w
+        odd_tags = ("oddrow",)
+        no_tags = ()
+        for idx, (title, category) in enumerate(zip(feed.titles, feed.categories)):
+            tcl_call(
+                widget, "insert", "", "end", "-id", str(idx),
+                "-values", (title, category or "-"),
+                "-tags", odd_tags if idx % 2 else no_tags,
             )
         self.content_text.delete("1.0", tk.END)
         self.image_refs.clear()
         self.category_var.set("Danh mục: -")
         self.current_article_link = None
-        self.current_categories = []
+        self.current_category = ""
         self.link_button.config(state=tk.DISABLED)
-        if not articles:
+        self.more_image_srcs = []
+        self._update_more_images_button()
+        if not feed.titles:
             self.content_text.insert(tk.END, "Không tìm thấy bài viết nào.")
 
     def on_article_selected(self, event: tk.Event) -> None:
@@ -254,97 +634,235 @@ class NewsReaderApp:
         if not selection:
             return
         index = int(selection[0])
-        article = self.articles[index]
-        self.current_article_link = article.link
-        self.current_categories = article.categories
-        self.category_var.set(
-            f"Danh mục: {', '.join(article.categories) if article.categories else 'Không rõ danh mục'}"
-        )
-        self.link_button.config(state=tk.NORMAL if article.link else tk.DISABLED)
+        link = self.article_links[index]
+        title = self.article_titles[index]
+        self.current_article_link = link
+        self.current_category = self.article_categories[index]
+        self.category_var.set(f"Danh mục: {self.current_category or 'Không rõ danh mục'}")
+        self.link_button.config(state=tk.NORMAL if link else tk.DISABLED)
+        self.more_image_srcs = []
+        self._update_more_images_button()
         self.content_text.delete("1.0", tk.END)
         self.content_text.insert(tk.END, "Đang tải nội dung bài viết...")
 
-        future = self.async_thread.submit(self.fetch_article(article.link))
-        future.add_done_callback(lambda fut: self._handle_article_result(fut, article.title))
-
-    def _handle_article_result(self, fut: asyncio.Future, title: str) -> None:
+        # Clicking through the list quickly must not leave every earlier article
+        # downloading its images and racing to fill the content pane.
+        self._cancel_article_fetch()
+        future = self.async_thread.submit(self.fetch_article(link))
+        self._current_fetch = future
+        future.add_done_callback(lambda fut: self._handle_article_result(fut, title))
+
+    def _cancel_article_fetch(self) -> None:
+        if self._current_fetch is not None:
+            self._current_fetch.cancel()
+            self._current_fetch = None
+        if self._more_images_fetch is not None:
+            self._more_images_fetch.cancel()
+            self._more_images_fetch = None
+
+    def _handle_article_result(self, fut: concurrent.futures.Future, title: str) -> None:
+        if fut.cancelled():
+            return
         try:
-            paragraphs, images = fut.result()
+            paragraphs, images, more_srcs = fut.result()
         except Exception as exc:  # noqa: BLE001
-            self.root.after(0, lambda: messagebox.showerror("Lỗi tải bài viết", str(exc)))
+            # Bind exc now: Python unbinds it when the except block ends.
+            self.root.after(0, lambda exc=exc: self._show_article_error(fut, exc))
             return
-        self.root.after(0, lambda: self.display_article(title, paragraphs, images))
-
-    async def fetch_article(self, url: str) -> tuple[list[str], list[Image.Image]]:
-        """Fetch article HTML and download embedded images asynchronously."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=20) as resp:
-                resp.raise_for_status()
-                page_html = await resp.text()
-
-            soup = BeautifulSoup(page_html, "html.parser")
-            paragraphs = [
-                html.unescape(p.get_text(strip=True)) for p in soup.find_all("p") if p.get_text(strip=True)
-            ]
-
-            images: list[Image.Image] = []
-            for img_el in soup.find_all("img"):
-                src = img_el.get("src")
-                if not src:
-                    continue
-                try:
-                    async with session.get(src, timeout=20) as img_resp:
+        self.root.after(0, lambda: self._show_article(fut, title, paragraphs, images, more_srcs))
+
+    def _show_article(
+        self,
+        fut: concurrent.futures.Future,
+        title: str,
+        paragraphs: List[str],
+        images: List[bytes],
+        more_srcs: List[str],
+    ) -> None:
+        # Only the latest selection may touch the UI; drop stale results.
+        if fut is self._current_fetch:
+            self._current_fetch = None
+            self.display_article(title, paragraphs, images, more_srcs)
+
+    def _show_article_error(self, fut: concurrent.futures.Future, exc: Exception) -> None:
+        if fut is self._current_fetch:
+            self._current_fetch = None
+            messagebox.showerror("Lỗi tải bài viết", str(exc))
+
+    async def _fetch_image(self, src: str, sem: asyncio.Semaphore) -> Optional[bytes]:
+        """Return display-ready data for one image, or ``None`` if it fails."""
+        cache = self.image_cache
+        key = cache.key_for(src)
+        image_data = cache.get(key)
+        if image_data is not None:
+            return image_data
+        cache_path = cache.path_for(key)
+        loop = asyncio.get_running_loop()
+        try:
+            # Decoding and resizing are blocking, keep them off the event loop.
+            if cache_path is not None:
+                image_data = await loop.run_in_executor(None, _load_cached_image, cache_path)
+            if image_data is None:
+                async with sem:
+                    async with self.async_thread.session.get(src, timeout=REQUEST_TIMEOUT) as img_resp:
                         img_resp.raise_for_status()
                         data = await img_resp.read()
-                    image = Image.open(BytesIO(data)).convert("RGB")
-                    images.append(image)
-                except Exception:
-                    # Skip images that fail to download or parse
-                    continue
-
-        return paragraphs, images
+                image_data = await loop.run_in_executor(None, _prepare_image_data, data, cache_path)
+                if cache_path is not None and cache.record_write():
+                    # Keep the disk cache bounded during long sessions, not just at startup.
+                    loop.run_in_executor(None, cache.prune)
+        except Exception:
+            # Skip images that fail to download or parse
+            return None
+        cache.put(key, image_data)
+        return image_data
+
+    async def fetch_images(self, srcs: List[str]) -> List[bytes]:
+        """Download the given images concurrently, dropping the ones that fail."""
+        sem = asyncio.Semaphore(MAX_IMAGE_DOWNLOADS)
+        results = await asyncio.gather(*(self._fetch_image(src, sem) for src in srcs))
+        return [image for image in results if image is not None]
+
+    async def fetch_article(self, url: str) -> tuple[list[str], list[bytes], list[str]]:
+        """Fetch article HTML and download embedded images asynchronously.
+
+        Only the first ``MAX_IMAGES`` distinct images are downloaded; the sources
+        of the rest are returned so the user can load them on demand.
+        """
+        session = self.async_thread.session
+        sem = asyncio.Semaphore(MAX_IMAGE_DOWNLOADS)
+
+        # One download per distinct URL: pages often repeat logos and thumbnails.
+        tasks: dict[str, asyncio.Task[Optional[bytes]]] = {}
+
+        def _dispatch(new_srcs: list[str]) -> None:
+            for src in new_srcs:
+                if len(tasks) >= MAX_IMAGES:
+                    return
+                if src not in tasks:
+                    tasks[src] = asyncio.create_task(self._fetch_image(src, sem))
 
-    def display_article(self, title: str, paragraphs: List[str], images: List[Image.Image]) -> None:
-        self.content_text.delete("1.0", tk.END)
+        try:
+            async with session.get(url, timeout=REQUEST_TIMEOUT) as resp:
+                resp.raise_for_status()
+                if HAS_LXML:
+                    # Parse while downloading and start each image fetch as soon
+                    # as its <img> tag arrives instead of after the whole page.
+                    collector = _ArticleCollector()
+                    parser = ET.HTMLParser(target=collector, encoding=resp.charset)
+                    seen = 0
+                    async for chunk in resp.content.iter_chunked(32768):
+                        parser.feed(chunk)
+                        _dispatch(collector.srcs[seen:])
+                        seen = len(collector.srcs)
+                    parser.close()
+                    paragraphs, srcs = collector.paragraphs, collector.srcs
+                else:
+                    # Raw bytes skip aiohttp's whole-body charset detection.
+                    paragraphs, srcs = _extract_article(await resp.read(), resp.charset)
+            _dispatch(srcs)
+            url_to_image = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+        except BaseException:
+            # Don't leave image downloads running if the page failed or the user
+            # already picked another article (cancellation lands here as well).
+            for task in tasks.values():
+                task.cancel()
+            raise
+        # Rebuild the list in source order so images still line up with paragraphs.
+        images = [url_to_image[src] for src in srcs if url_to_image.get(src) is not None]
+        more_srcs = [src for src in dict.fromkeys(srcs) if src not in tasks]
+        return paragraphs, images, more_srcs
+
+    def display_article(
+        self, title: str, paragraphs: List[str], images: List[bytes], more_srcs: List[str]
+    ) -> None:
+        text = self.content_text
+        text.delete("1.0", tk.END)
         self.image_refs.clear()
-        self.content_text.insert(tk.END, f"{title}\n\n", ("title",))
-        self.content_text.tag_config("title", font=("Arial", 15, "bold"))
+        category_label = self.current_category or "Không rõ danh mục"
+        text.insert(
+            tk.END,
+            f"{title}\n\n", ("title",),
+            f"Danh mục: {category_label}\n", ("meta",),
+            f"Liên kết gốc: {self.current_article_link}\n\n", ("link",),
+        )
 
-        category_label = ", ".join(self.current_categories) if self.current_categories else "Không rõ danh mục"
-        self.content_text.insert(tk.END, f"Danh mục: {category_label}\n", ("meta",))
-        self.content_text.insert(tk.END, f"Liên kết gốc: {self.current_article_link}\n\n", ("link",))
-        self.content_text.tag_config("meta", font=("Arial", 10, "italic"))
-        self.content_text.tag_config("link", foreground="#1a73e8", underline=1)
-        self.content_text.tag_bind("link", "<Button-1>", lambda _event: self.open_current_article())
+        # Every Text.insert is a Tcl round-trip plus a relayout, so text between
+        # two images is collected and inserted with a single call.
+        pending: list[str] = []
+
+        def _flush() -> None:
+            if pending:
+                text.insert(tk.END, "".join(pending))
+                pending.clear()
 
         img_iter = iter(images)
-        for idx, para in enumerate(paragraphs):
-            self.content_text.insert(tk.END, para + "\n\n")
-            try:
-                image = next(img_iter)
-            except StopIteration:
-                continue
-            photo = self._prepare_image_for_display(image)
-            if photo:
-                self.content_text.image_create(tk.END, image=photo)
-                self.content_text.insert(tk.END, "\n\n")
-                self.image_refs.append(photo)
+        for para in paragraphs:
+            pending.append(para + "\n\n")
+            image = next(img_iter, None)
+            if image is not None:
+                self._insert_image(image, before=_flush)
+                pending.append("\n\n")
 
         # Append any leftover images if there were more images than paragraphs.
         for image in img_iter:
-            photo = self._prepare_image_for_display(image)
-            if photo:
-                self.content_text.image_create(tk.END, image=photo)
-                self.content_text.insert(tk.END, "\n\n")
-                self.image_refs.append(photo)
-
-    def _prepare_image_for_display(self, image: Image.Image) -> Optional[ImageTk.PhotoImage]:
-        max_width = 700
-        if image.width > max_width:
-            ratio = max_width / image.width
-            new_size = (int(image.width * ratio), int(image.height * ratio))
-            image = image.resize(new_size, Image.LANCZOS)
-        return ImageTk.PhotoImage(image)
+            self._insert_image(image, before=_flush)
+            pending.append("\n\n")
+        _flush()
+
+        self.more_image_srcs = more_srcs
+        self._update_more_images_button()
+
+    def _insert_image(self, image_data: bytes, before: Optional[Callable[[], None]] = None) -> None:
+        """Embed an image at the end of the content pane.
+
+        ``before`` runs just ahead of the image, e.g. to flush pending text.
+        """
+        photo = self._prepare_image_for_display(image_data)
+        if before is not None:
+            before()
+        self.content_text.image_create(tk.END, image=photo)
+        self.image_refs.append(photo)
+
+    def _update_more_images_button(self) -> None:
+        if self.more_image_srcs:
+            self.more_images_button.config(
+                text=f"Tải thêm ảnh ({len(self.more_image_srcs)})", state=tk.NORMAL
+            )
+        else:
+            self.more_images_button.config(text="Tải thêm ảnh", state=tk.DISABLED)
+
+    def load_more_images(self) -> None:
+        srcs, self.more_image_srcs = self.more_image_srcs, []
+        if not srcs:
+            return
+        self._update_more_images_button()
+        future = self.async_thread.submit(self.fetch_images(srcs))
+        self._more_images_fetch = future
+        future.add_done_callback(self._handle_more_images_result)
+
+    def _handle_more_images_result(self, fut: concurrent.futures.Future) -> None:
+        if fut.cancelled():
+            return
+        # _fetch_image already drops images that fail, so the batch itself can't.
+        images = fut.result()
+        self.root.after(0, lambda: self.append_images(fut, images))
+
+    def append_images(self, fut: concurrent.futures.Future, images: List[bytes]) -> None:
+        # The user may have opened another article, or reopened this one, while
+        # these were loading; only the batch for the current view is appended.
+        if fut is not self._more_images_fetch:
+            return
+        self._more_images_fetch = None
+        for image in images:
+            self._insert_image(image)
+            self.content_text.insert(tk.END, "\n\n")
+
+    def _prepare_image_for_display(self, image_data: bytes) -> tk.PhotoImage:
+        # Images arrive already resized and encoded by _prepare_image_data; only
+        # the PhotoImage itself has to be created on the main thread. The data
+        # is always PPM written by Pillow, so a TclError here is a real bug.
+        return tk.PhotoImage(data=image_data, format="ppm")
 
     def open_current_article(self) -> None:
         if self.current_article_link: